@@ -1,20 +1,162 @@
 """ElevenLabs TTS plugin for OVOS."""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
 import os
+import shutil
+import struct
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
+import httpx
 from elevenlabs import VoiceSettings
 from elevenlabs.client import ElevenLabs
 from ovos_plugin_manager.templates.tts import TTS, TTSValidator
 from ovos_utils.log import LOG
 
 
+def _debug_enabled() -> bool:
+    """Whether DEBUG logging is on; ovos LOG has no isEnabledFor of its own."""
+    level = LOG.level
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    return isinstance(level, int) and level <= logging.DEBUG
+
+
+# Temp files older than this were left by a crashed writer and can be removed
+_STALE_PART_SECONDS = 3600
+
+
+def _cache_dir() -> Path:
+    """Get the local cache of synthesized audio, keyed on everything that affects the output.
+
+    Resolved on use rather than at import, and without Path.home(), so the plugin
+    still imports where there is no home directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "ovos-tts-elevenlabs"
+
+
+def _tmp_path(cache_path: Path) -> Path:
+    """Get a per-thread temp path for writing a cache entry."""
+    return cache_path.with_name(f"{cache_path.stem}.{threading.get_ident()}.part")
+
+
+def _format_value(output_format: str) -> str:
+    """Get the plain string value of an output format."""
+    return getattr(output_format, "value", output_format)
+
+
+def _audio_ext(output_format: str) -> str:
+    """Get the file extension for audio in the given output format."""
+    codec = _format_value(output_format).split("_", 1)[0]
+    if codec in ("pcm", "ulaw"):
+        return "wav"
+    return codec
+
+
+def _wav_format(output_format: str) -> tuple[int, int, int] | None:
+    """Get (format tag, sample rate, bits per sample) for raw formats needing a WAV header."""
+    codec, _, rest = _format_value(output_format).partition("_")
+    if codec == "pcm":
+        return 1, int(rest.split("_")[0]), 16
+    if codec == "ulaw":
+        return 7, int(rest.split("_")[0]), 8
+    return None
+
+
+def _wav_header(wav_format: tuple[int, int, int], data_size: int | None = None) -> bytes:
+    """Build a mono RIFF/WAVE header for raw audio of the given format.
+
+    Without a data_size the header carries the largest placeholder length, for
+    streaming before the real length is known. Non-PCM formats such as u-law
+    get the 18-byte fmt chunk and the fact chunk the WAVE spec requires.
+    """
+    format_tag, sample_rate, bits = wav_format
+    block_align = bits // 8
+    fmt = struct.pack("<HHIIHH", format_tag, 1, sample_rate,
+                      sample_rate * block_align, block_align, bits)
+    pcm = format_tag == 1
+    if pcm:
+        fmt_chunk = b"fmt " + struct.pack("<I", 16) + fmt
+    else:
+        # Extended fmt chunk with an empty cbSize
+        fmt_chunk = b"fmt " + struct.pack("<I", 18) + fmt + struct.pack("<H", 0)
+    # Everything in the RIFF chunk apart from the audio itself
+    riff_overhead = 4 + len(fmt_chunk) + (0 if pcm else 12) + 8
+    if data_size is None:
+        data_size = 0xFFFFFFFF - riff_overhead
+    fact_chunk = b"" if pcm else b"fact" + struct.pack("<II", 4, data_size // block_align)
+    return (b"RIFF" + struct.pack("<I", riff_overhead + data_size) + b"WAVE"
+            + fmt_chunk + fact_chunk + b"data" + struct.pack("<I", data_size))
+
+
+def _finish_wav(f, wav_format: tuple[int, int, int]) -> None:
+    """Rewrite the header of a WAV file positioned at its end with the real data size."""
+    data_size = f.tell() - len(_wav_header(wav_format))
+    f.seek(0)
+    f.write(_wav_header(wav_format, data_size))
+
+
+def _remove_prefetched(future: Future) -> None:
+    """Delete the private file of a prefetch that was never claimed."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        os.remove(future.result()[0])
+    except OSError:
+        pass
+
+
+# One client per API key so all plugin instances share a keep-alive connection pool
+_CLIENT_CACHE: dict[str, ElevenLabs] = {}
+_CLIENT_LOCK = threading.Lock()
+_HTTP_TIMEOUT = httpx.Timeout(connect=5, read=60, write=10, pool=5)
+
+
+def _get_client(api_key: str) -> ElevenLabs:
+    """Get the shared ElevenLabs client for an API key, creating it if needed."""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            # The SDK sends its own timeout with every request, overriding the httpx
+            # client default, so it has to be given the full Timeout as well
+            client = ElevenLabs(
+                api_key=api_key,
+                timeout=_HTTP_TIMEOUT,
+                httpx_client=httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=8,
+                                        max_connections=16,
+                                        keepalive_expiry=60),
+                    timeout=_HTTP_TIMEOUT,
+                    http2=True
+                )
+            )
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
 class OutputFormat(str, Enum):
     """Supported output formats."""
     MP3_44100_128 = "mp3_44100_128"
     MP3_44100_64 = "mp3_44100_64"
     MP3_22050_32 = "mp3_22050_32"
+    PCM_16000 = "pcm_16000"
+    PCM_22050 = "pcm_22050"
+    PCM_24000 = "pcm_24000"
+    ULAW_8000 = "ulaw_8000"
+    OPUS_48000_64 = "opus_48000_64"
 
 
 @dataclass
@@ -28,32 +170,101 @@ class TTSConfiguration:
     DEFAULT_SPEAKER_BOOST = True
     DEFAULT_OUTPUT_FORMAT = OutputFormat.MP3_44100_128
     DEFAULT_USE_STREAMING = False
+    DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+    # Bytes on disk before a streamed get_tts returns; 0 waits for the whole stream.
+    # Returning early only works with a player that tails the growing file.
+    DEFAULT_STREAM_INITIAL_BYTES = 0
+    DEFAULT_STREAM_TIMEOUT = 120  # Seconds get_tts waits on a streamed response
+    DEFAULT_TTS_CONCURRENCY = 3
 
 
 class ElevenLabsTTSPlugin(TTS):
     """TTS plugin for ElevenLabs."""
 
     # Define available_languages as a class variable instead of a property
-    available_languages = {
+    available_languages = frozenset({
         "en", "es", "fr", "de", "it", "pt", "pl", "hi",
         "ar", "bn", "cs", "da", "nl", "fi", "el", "hu",
         "id", "ja", "ko", "ms", "no", "ro", "ru", "sk",
         "sv", "ta", "tr", "uk", "ur", "vi", "zh", "bg"
-    }
+    })
 
     def __init__(self, *args, **kwargs):
         LOG.debug("Initializing ElevenLabsTTS")
         # Let validation exceptions propagate up
+        self._valid_voice_ids: set | None = None
         super().__init__(*args, **kwargs, audio_ext="mp3",
                         validator=ElevenLabsTTSValidator(self))
         LOG.debug("Super init complete")
-        self.client = ElevenLabs(api_key=self.api_key)
+        # Snapshot config so the properties below are plain dict lookups
+        self._cfg: dict[str, Any] = dict(self.config)
+        # Raw PCM and u-law are wrapped in a WAV header, so not every format is mp3
+        self.audio_ext = self._config_audio_ext(self._cfg)
+        self._bind_client()
+        self._bind_config()
         LOG.debug("Client initialized")
+        # Single slot for synthesizing the next sentence while the current one plays
+        self._prefetch: Future | None = None
+        self._prefetch_key: tuple[str, str, str | None] | None = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1,
+                                                     thread_name_prefix="elevenlabs-prefetch")
+
+    def reload(self) -> None:
+        """Re-read config after it changes and drop values derived from it."""
+        self._cfg = dict(self.config)
+        self.audio_ext = self._config_audio_ext(self._cfg)
+        # The API key may have changed, and with it the client and the voices it can see
+        self._bind_client()
+        self._valid_voice_ids = None
+        # Drop the memoized VoiceSettings so _bind_config builds it from the new config
+        self.__dict__.pop("_voice_settings_obj", None)
+        self._bind_config()
+        # Anything prefetched was synthesized with the old config
+        self._clear_prefetch()
+
+    def shutdown(self) -> None:
+        """Cancel any pending prefetch and stop its worker thread."""
+        # The base class calls this from __del__, possibly after a failed __init__
+        if hasattr(self, "_prefetch_executor"):
+            self._clear_prefetch()
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        super().shutdown()
+
+    @staticmethod
+    def _config_audio_ext(config: dict[str, Any]) -> str:
+        """Get the audio file extension for the output format in a plugin config."""
+        return _audio_ext(config.get("output_format", TTSConfiguration.DEFAULT_OUTPUT_FORMAT))
+
+    def _bind_client(self) -> None:
+        """Bind the shared client for the configured API key and its SDK calls."""
+        self.client = _get_client(self.api_key)
+        # Bind the SDK calls once, not on every sentence
+        self._convert = self.client.text_to_speech.convert
+        self._convert_stream = self.client.text_to_speech.convert_as_stream
+
+    def _bind_config(self) -> None:
+        """Build the text_to_speech arguments and cache key inputs that depend only on config."""
+        voice_id = self.voice_id
+        model_id = self.model_id
+        output_format = self.output_format
+        self._synth_kwargs: dict[str, Any] = {
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "output_format": output_format,
+            "voice_settings": self._voice_settings_obj
+        }
+        self._cache_key_args = (voice_id, model_id, output_format, self.voice_settings)
+
+    @property
+    def primary_lang(self) -> str:
+        """Primary language code, e.g. "en" for "en-US"."""
+        return self.lang.split("-", 1)[0].lower()
 
     @property
     def api_key(self) -> str:
         """Get API key from config."""
-        api_key = self.config.get("api_key") or os.getenv("ELEVENLABS_API_KEY")
+        api_key = self._cfg.get("api_key") or os.getenv("ELEVENLABS_API_KEY")
         if not api_key:
             raise ValueError("ElevenLabs API key not found in config or environment")
         return api_key
@@ -61,84 +272,327 @@ class ElevenLabsTTSPlugin(TTS):
     @property
     def voice_id(self) -> str:
         """Get voice ID from config."""
-        voice_id = self.config.get("voice_id")
+        voice_id = self._cfg.get("voice_id")
 
         # If no voice_id configured, use default
         if not voice_id:
-            LOG.debug(f"No voice_id configured, using default: {TTSConfiguration.DEFAULT_VOICE_ID}")
             voice_id = TTSConfiguration.DEFAULT_VOICE_ID
 
-        LOG.debug(f"Using configured voice_id: {voice_id}")
         return voice_id
 
     @property
     def model_id(self) -> str:
         """Get model ID from config."""
-        return self.config.get("model_id", TTSConfiguration.DEFAULT_MODEL)
+        return self._cfg.get("model_id", TTSConfiguration.DEFAULT_MODEL)
 
     @property
     def use_streaming(self) -> bool:
         """Whether to use streaming API."""
-        return self.config.get("use_streaming", TTSConfiguration.DEFAULT_USE_STREAMING)
+        return self._cfg.get("use_streaming", TTSConfiguration.DEFAULT_USE_STREAMING)
 
     @property
     def output_format(self) -> str:
         """Get output format from config."""
-        return self.config.get("output_format", TTSConfiguration.DEFAULT_OUTPUT_FORMAT)
+        return self._cfg.get("output_format", TTSConfiguration.DEFAULT_OUTPUT_FORMAT)
+
+    @property
+    def cache_max_bytes(self) -> int:
+        """Get maximum size of the audio cache from config."""
+        return self._cfg.get("cache_max_bytes", TTSConfiguration.DEFAULT_CACHE_MAX_BYTES)
+
+    @property
+    def stream_initial_bytes(self) -> int:
+        """Get how much streamed audio must be on disk before returning."""
+        return self._cfg.get("stream_initial_bytes",
+                             TTSConfiguration.DEFAULT_STREAM_INITIAL_BYTES)
+
+    @property
+    def stream_timeout(self) -> float:
+        """Get how long a streamed get_tts may wait before giving up."""
+        return self._cfg.get("stream_timeout", TTSConfiguration.DEFAULT_STREAM_TIMEOUT)
+
+    @property
+    def tts_concurrency(self) -> int:
+        """Get how many sentences may be synthesized at once."""
+        return self._cfg.get("tts_concurrency", TTSConfiguration.DEFAULT_TTS_CONCURRENCY)
 
     @property
-    def voice_settings(self) -> Dict[str, Any]:
+    def voice_settings(self) -> dict[str, Any]:
         """Get voice settings from config."""
         return {
-            "stability": self.config.get("stability", TTSConfiguration.DEFAULT_STABILITY),
-            "similarity_boost": self.config.get("similarity_boost",
+            "stability": self._cfg.get("stability", TTSConfiguration.DEFAULT_STABILITY),
+            "similarity_boost": self._cfg.get("similarity_boost",
                                               TTSConfiguration.DEFAULT_SIMILARITY),
-            "style": self.config.get("style", TTSConfiguration.DEFAULT_STYLE),
-            "use_speaker_boost": self.config.get("speaker_boost",
+            "style": self._cfg.get("style", TTSConfiguration.DEFAULT_STYLE),
+            "use_speaker_boost": self._cfg.get("speaker_boost",
                                                TTSConfiguration.DEFAULT_SPEAKER_BOOST)
         }
 
+    @functools.cached_property
+    def _voice_settings_obj(self) -> VoiceSettings:
+        """VoiceSettings built from config, reused across calls."""
+        return VoiceSettings(**self.voice_settings)
+
+    @staticmethod
+    def _cache_path(sentence: str, voice_id: str, model_id: str,
+                    output_format: str, voice_settings: dict[str, Any]) -> Path:
+        """Get the cache file path for a sentence with the given settings."""
+        key = hashlib.sha256(json.dumps(
+            [sentence, voice_id, model_id, output_format, voice_settings],
+            sort_keys=True
+        ).encode()).hexdigest()
+        return _cache_dir() / f"{key}.{_audio_ext(output_format)}"
+
+    def _evict_cache(self) -> None:
+        """Remove least recently used cache entries until under the size limit.
+
+        Temp files abandoned by a crashed writer are removed as well.
+        """
+        entries = []
+        stale_before = time.time() - _STALE_PART_SECONDS
+        try:
+            paths = list(_cache_dir().iterdir())
+        except OSError as e:
+            LOG.warning(f"Could not scan audio cache: {str(e)}")
+            return
+        for path in paths:
+            try:
+                st = path.stat()
+                if path.suffix != ".part":
+                    entries.append((path, st))
+                elif st.st_mtime < stale_before:
+                    path.unlink()
+            except OSError:
+                # Evicted or renamed by another thread while scanning
+                pass
+
+        total = sum(st.st_size for _, st in entries)
+        if total <= self.cache_max_bytes:
+            return
+
+        # Oldest mtime first; cache hits touch the file so this is LRU order
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= st.st_size
+            except OSError:
+                pass
+
+    def _store_cache(self, out_path: str, cache_path: Path) -> None:
+        """Copy finished audio into the cache; failures only cost future cache hits."""
+        tmp_path = _tmp_path(cache_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(out_path, tmp_path)
+            # Atomic rename so readers never see a partial cache entry
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            LOG.warning(f"Could not store audio in cache: {str(e)}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        self._evict_cache()
+
+    def _write_audio(self, audio_stream: Iterable[bytes], out_path: str,
+                     wav_format: tuple[int, int, int] | None = None) -> None:
+        """Write an audio stream to out_path, adding a WAV header for raw formats."""
+        # Large buffer so small stream chunks don't each cost a syscall
+        with open(out_path, "wb", buffering=1 << 20) as f:
+            write = f.write
+            if wav_format:
+                write(_wav_header(wav_format))
+            start = f.tell()
+            for chunk in audio_stream:
+                if chunk:
+                    write(chunk)
+            size = f.tell()
+            if size == start:
+                raise ValueError("ElevenLabs returned no audio")
+            if wav_format:
+                _finish_wav(f, wav_format)
+        if _debug_enabled():
+            LOG.debug("Successfully wrote %d bytes to %s", size, out_path)
+
+    def _stream_audio(self, audio_stream: Iterable[bytes], out_path: str, cache_path: Path,
+                      wav_format: tuple[int, int, int] | None = None) -> None:
+        """Write an audio stream to out_path from a background thread.
+
+        Returns once the whole stream is written, or, if stream_initial_bytes is
+        set, once that much audio is on disk. Early return hands playback a file
+        that is still growing, so it requires a player that tails the file rather
+        than stopping at EOF. Raw formats get a WAV header with a placeholder
+        length, which is corrected once the stream completes. The finished file
+        is then copied into the cache.
+
+        Errors raised before returning are re-raised here. If nothing is ready
+        within stream_timeout seconds the writer is cancelled and TimeoutError
+        is raised. A stream that fails after an early return can only be
+        logged, so the partial out_path is removed rather than left looking
+        like a complete utterance.
+        """
+        ready = threading.Event()
+        cancelled = threading.Event()
+        errors: list[Exception] = []
+        initial_bytes = self.stream_initial_bytes
+
+        def _writer():
+            written = 0
+            try:
+                # Unbuffered so playback sees each chunk as soon as it arrives
+                with open(out_path, "wb", buffering=0) as out:
+                    if wav_format:
+                        out.write(_wav_header(wav_format))
+                    for chunk in audio_stream:
+                        if cancelled.is_set():
+                            raise TimeoutError("ElevenLabs stream cancelled")
+                        if not chunk:
+                            continue
+                        out.write(chunk)
+                        written += len(chunk)
+                        if initial_bytes and written >= initial_bytes:
+                            ready.set()
+                    if not written:
+                        raise ValueError("ElevenLabs returned no audio")
+                    if wav_format:
+                        _finish_wav(out, wav_format)
+                if _debug_enabled():
+                    LOG.debug("Finished streaming %d bytes to %s", written, out_path)
+                self._store_cache(out_path, cache_path)
+            except Exception as e:
+                if ready.is_set():
+                    LOG.error(f"ElevenLabs stream interrupted: {str(e)}")
+                # Never leave truncated audio behind for playback or a TTS cache to reuse
+                try:
+                    os.remove(out_path)
+                except OSError:
+                    pass
+                errors.append(e)
+            finally:
+                ready.set()
+
+        threading.Thread(target=_writer, daemon=True).start()
+        if not ready.wait(self.stream_timeout):
+            cancelled.set()
+            raise TimeoutError(f"ElevenLabs stream not ready within {self.stream_timeout}s")
+        if errors:
+            raise errors[0]
+
+    def prefetch(self, sentence: str, wav_file: str, lang: str | None = None) -> None:
+        """Start synthesizing a sentence in the background.
+
+        A later get_tts call with the same sentence, wav_file and lang waits for
+        this result instead of calling the API again. Only the most recent
+        prefetch is kept.
+
+        The audio is written to a private file next to wav_file and only moved
+        into place when get_tts claims it, so a prefetch that is displaced or
+        made stale by reload() can never overwrite wav_file.
+        """
+        root, ext = os.path.splitext(wav_file)
+        private_file = f"{root}.prefetch-{uuid.uuid4().hex}{ext}"
+        with self._prefetch_lock:
+            self._drop_prefetch()
+            self._prefetch_key = (sentence, wav_file, lang)
+            self._prefetch = self._prefetch_executor.submit(
+                self._synthesize, sentence, private_file, lang)
+
+    def _clear_prefetch(self) -> None:
+        """Drop the prefetch slot."""
+        with self._prefetch_lock:
+            self._drop_prefetch()
+
+    def _drop_prefetch(self) -> None:
+        """Drop the prefetch slot; the caller must hold _prefetch_lock.
+
+        A prefetch that has not started is cancelled. One already running is left
+        to finish, and its private file is deleted when it does.
+        """
+        if self._prefetch is not None and not self._prefetch.cancel():
+            self._prefetch.add_done_callback(_remove_prefetched)
+        self._prefetch = self._prefetch_key = None
+
     def get_tts(self, sentence: str, wav_file: str,
-            lang: Optional[str] = None) -> Tuple[str, Optional[str]]:
+            lang: str | None = None) -> tuple[str, str | None]:
         """Convert text to speech using ElevenLabs API."""
+        with self._prefetch_lock:
+            prefetched = None
+            if self._prefetch_key == (sentence, wav_file, lang):
+                prefetched = self._prefetch
+                self._prefetch = self._prefetch_key = None
+        if prefetched is not None:
+            if _debug_enabled():
+                LOG.debug("Using prefetched audio")
+            private_file, phonemes = prefetched.result()
+            out_path = self._audio_path(wav_file, os.path.splitext(private_file)[1])
+            os.replace(private_file, out_path)
+            return out_path, phonemes
+        return self._synthesize(sentence, wav_file, lang)
+
+    @staticmethod
+    def _audio_path(wav_file: str, audio_ext: str) -> str:
+        """Get the path to write audio with the given extension for a requested wav_file."""
+        root, ext = os.path.splitext(wav_file)
+        return wav_file if ext.lower() == audio_ext else root + audio_ext
+
+    def _synthesize(self, sentence: str, wav_file: str,
+                    lang: str | None = None) -> tuple[str, str | None]:
+        """Synthesize a sentence, using the local cache when possible."""
+        # ovos LOG inspects the call stack on every call, so skip it entirely unless needed
+        debug = _debug_enabled()
         try:
-            # Ensure output path has .mp3 extension
-            out_path = wav_file.replace(".wav", ".mp3")
-            LOG.debug(f"Converting text to speech: {sentence[:20]}...")
-            LOG.debug(f"Output path: {out_path}")
-            LOG.debug(f"Using streaming: {self.use_streaming}")
-            LOG.debug(f"Using voice_id: {self.voice_id}")
-
-            if self.use_streaming:
+            # Read config once per call rather than through the properties each time
+            synth_kwargs = self._synth_kwargs
+            voice_id = synth_kwargs["voice_id"]
+            output_format = synth_kwargs["output_format"]
+            streaming = self.use_streaming
+            wav_format = _wav_format(output_format)
+
+            # Ensure output path has the extension matching the output format
+            out_path = self._audio_path(wav_file, "." + _audio_ext(output_format))
+
+            cache_path = self._cache_path(sentence, *self._cache_key_args)
+            try:
+                # Refresh mtime for LRU eviction; unlike touch() this never recreates an
+                # entry another thread has just evicted
+                os.utime(cache_path)
+                shutil.copyfile(cache_path, out_path)
+                if debug:
+                    LOG.debug("Using cached audio: %s", cache_path)
+                return out_path, None
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # The cache is only an optimisation; synthesize as if it missed
+                LOG.warning(f"Could not read audio cache: {str(e)}")
+
+            if debug:
+                LOG.debug("Converting text to speech: %s...", sentence[:20])
+                LOG.debug("Output path: %s", out_path)
+                LOG.debug("Using streaming: %s", streaming)
+                LOG.debug("Using voice_id: %s", voice_id)
+
+            if streaming:
                 # Streaming approach
-                LOG.debug("Using streaming API")
-                audio_stream = self.client.text_to_speech.convert_as_stream(
-                    text=sentence,
-                    voice_id=self.voice_id,
-                    model_id=self.model_id,
-                    output_format=self.output_format,
-                    voice_settings=VoiceSettings(**self.voice_settings)
-                )
-            else:
-                # Non-streaming approach still returns a generator
+                if debug:
+                    LOG.debug("Using streaming API")
+                audio_stream = self._convert_stream(text=sentence, **synth_kwargs)
+                # Hand the file to playback as soon as the first audio is on disk
+                self._stream_audio(audio_stream, out_path, cache_path, wav_format)
+                return out_path, None
+
+            # Non-streaming approach still returns a generator
+            if debug:
                 LOG.debug("Using non-streaming API")
-                audio_stream = self.client.text_to_speech.convert(
-                    text=sentence,
-                    voice_id=self.voice_id,
-                    model_id=self.model_id,
-                    output_format=self.output_format,
-                    voice_settings=VoiceSettings(**self.voice_settings)
-                )
+            audio_stream = self._convert(text=sentence, **synth_kwargs)
 
-            # Write stream to file - both approaches use the same write logic
-            LOG.debug("Writing audio stream to file")
-            bytes_written = 0
-            with open(out_path, "wb") as f:
-                for chunk in audio_stream:
-                    if chunk:
-                        f.write(chunk)
-                        bytes_written += len(chunk)
-            LOG.debug(f"Successfully wrote {bytes_written} bytes to {out_path}")
+            if debug:
+                LOG.debug("Writing audio stream to file")
+            self._write_audio(audio_stream, out_path, wav_format)
+            self._store_cache(out_path, cache_path)
 
             return out_path, None
 
@@ -146,6 +600,22 @@ class ElevenLabsTTSPlugin(TTS):
             LOG.error(f"ElevenLabs TTS error: {str(e)}")
             raise
 
+    def get_tts_batch(self, sentences: list[str], wav_files: list[str],
+                      lang: str | None = None) -> Iterator[tuple[str, str | None]]:
+        """Synthesize several sentences concurrently.
+
+        Results are yielded in the order the sentences were given, each as soon as
+        it and every sentence before it are done.
+        """
+        if len(sentences) != len(wav_files):
+            raise ValueError("sentences and wav_files must be the same length")
+
+        with ThreadPoolExecutor(max_workers=max(1, self.tts_concurrency)) as pool:
+            futures = [pool.submit(self.get_tts, sentence, wav_file, lang)
+                       for sentence, wav_file in zip(sentences, wav_files)]
+            for future in futures:
+                yield future.result()
+
 
 class ElevenLabsTTSValidator(TTSValidator):
     """Validator for ElevenLabs TTS plugin."""
@@ -163,6 +633,11 @@ class ElevenLabsTTSValidator(TTSValidator):
                 "pip install elevenlabs"
             )
 
+    def validate_instance(self):
+        """Validate the plugin instance, including its configured voice."""
+        super().validate_instance()
+        self.validate_voice()
+
     def validate_connection(self):
         """Validate connection to ElevenLabs API."""
         try:
@@ -172,30 +647,38 @@ class ElevenLabsTTSValidator(TTSValidator):
             LOG.error(f"Error connecting to ElevenLabs API: {str(e)}")
             raise
 
-    def validate_voice(self):
-        """Validate the configured voice exists."""
+    def validate_voice(self, refresh: bool = False):
+        """Validate the configured voice exists.
+
+        Voice IDs fetched by an earlier successful validation are reused; pass
+        refresh=True to fetch them from the API again.
+        """
+        voice_id = self.tts.voice_id
+        cached = self.tts._valid_voice_ids
+        if not refresh and cached and voice_id in cached:
+            return
+
         LOG.debug("Fetching voices from ElevenLabs API...")
         voices = self.tts.client.voices.get_all()
 
         # Extract all voice IDs from the response
-        voice_ids = [v.voice_id for v in voices]
+        voice_ids = {v.voice_id for v in voices}
         LOG.debug(f"Available voice IDs: {voice_ids}")
-        LOG.debug(f"Configured voice ID: {self.tts.voice_id}")
+        LOG.debug(f"Configured voice ID: {voice_id}")
 
         if not voice_ids:
             raise ValueError("No voices available from API - check API key permissions")
 
-        if self.tts.voice_id not in voice_ids:
+        if voice_id not in voice_ids:
             raise ValueError(
-                f"Voice ID '{self.tts.voice_id}' not found in available voices: {voice_ids}"
+                f"Voice ID '{voice_id}' not found in available voices: {voice_ids}"
             )
 
+        self.tts._valid_voice_ids = voice_ids
+
     def validate_lang(self):
         """Validate language is supported."""
-        # Extract primary language code before hyphen
-        # e.g., "en-US" -> "en"
-        primary_lang = self.tts.lang.split('-')[0].lower()
-        if primary_lang not in self.tts.available_languages:
+        if self.tts.primary_lang not in self.tts.available_languages:
             raise ValueError(
                 f"Language {self.tts.lang} not supported. "
                 f"Supported languages: {self.tts.available_languages}"
@@ -206,21 +689,28 @@ class ElevenLabsTTSValidator(TTSValidator):
         return ElevenLabsTTSPlugin
 
 
+# Default values shared by every language's sample configuration; read-only
+# because each entry shallow-copies it rather than building its own
+_TEMPLATE = MappingProxyType({
+    "offline": False,
+    "priority": 70,
+    "model_id": TTSConfiguration.DEFAULT_MODEL,
+    "voice_id": TTSConfiguration.DEFAULT_VOICE_ID,
+    "stability": TTSConfiguration.DEFAULT_STABILITY,
+    "similarity_boost": TTSConfiguration.DEFAULT_SIMILARITY,
+    "style": TTSConfiguration.DEFAULT_STYLE,
+    "speaker_boost": TTSConfiguration.DEFAULT_SPEAKER_BOOST,
+    "use_streaming": TTSConfiguration.DEFAULT_USE_STREAMING,
+    "output_format": TTSConfiguration.DEFAULT_OUTPUT_FORMAT,
+    "cache_max_bytes": TTSConfiguration.DEFAULT_CACHE_MAX_BYTES,
+    "stream_initial_bytes": TTSConfiguration.DEFAULT_STREAM_INITIAL_BYTES,
+    "stream_timeout": TTSConfiguration.DEFAULT_STREAM_TIMEOUT,
+    "tts_concurrency": TTSConfiguration.DEFAULT_TTS_CONCURRENCY
+})
+
+
 # Sample valid configurations per language
 ElevenLabsTTSConfig = {
-    # Generate for all supported languages
-    lang: [{
-        "lang": lang,
-        "display_name": f"ElevenLabs TTS ({lang})",
-        "offline": False,
-        "priority": 70,
-        "model_id": TTSConfiguration.DEFAULT_MODEL,
-        "voice_id": TTSConfiguration.DEFAULT_VOICE_ID,
-        "stability": TTSConfiguration.DEFAULT_STABILITY,
-        "similarity_boost": TTSConfiguration.DEFAULT_SIMILARITY,
-        "style": TTSConfiguration.DEFAULT_STYLE,
-        "speaker_boost": TTSConfiguration.DEFAULT_SPEAKER_BOOST,
-        "use_streaming": TTSConfiguration.DEFAULT_USE_STREAMING,
-        "output_format": TTSConfiguration.DEFAULT_OUTPUT_FORMAT
-    }] for lang in ElevenLabsTTSPlugin.available_languages
+    lang: [{**_TEMPLATE, "lang": lang, "display_name": f"ElevenLabs TTS ({lang})"}]
+    for lang in ElevenLabsTTSPlugin.available_languages
 }